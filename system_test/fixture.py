@@ -31,12 +31,16 @@ import pathlib
 import textwrap
 import json
 import tarfile
+import tempfile
+import zlib
 import shutil
 import subprocess
 import time
 import socket
 import atexit
 import textwrap
+import functools
+import http.client
 import urllib.request
 import urllib.parse
 import urllib.error
@@ -65,6 +69,7 @@ def retry(
     every=0.05,
     msg='Timed out retrying',
     backoff_till=5.0,
+    backoff_factor=1.25,
     lead_sleep=0.1):
     """
     Repeat task every `interval` until it returns a truthy value or times out.
@@ -77,14 +82,22 @@ def retry(
         res = predicate_task()
         if res:
             return res
-        elif time.monotonic() < threshold:
-            time.sleep(every)
+        now = time.monotonic()
+        if now < threshold:
+            # Don't oversleep the deadline: allow one last check at the end.
+            time.sleep(min(every, threshold - now))
             if backoff_till:
-                every = min(backoff_till, every * 1.25)
+                every = min(backoff_till, every * backoff_factor)
         else:
             raise TimeoutError(msg)
 
 
+@functools.lru_cache(maxsize=256)
+def _exec_path(sql_query):
+    # The same queries are re-sent on every `retry_check_table` poll.
+    return '/exec?' + urllib.parse.urlencode({'query': sql_query})
+
+
 def discover_avail_ports(num_required):
     """Discover available TCP listening ports."""
     # We need to find free ports.
@@ -115,8 +128,12 @@ class Project:
         self.tls_certs_dir = self.root_dir / 'tls_certs'
         self.questdb_dir = self.build_dir / 'questdb'
         self.questdb_dir.mkdir(exist_ok=True)
-        self.questdb_downloads_dir = self.questdb_dir / 'downloads'
-        self.questdb_downloads_dir.mkdir(exist_ok=True)
+        # Opt-in: Set `QDB_DOWNLOADS_DIR` outside the build dir
+        # to reuse downloads across clean builds.
+        self.questdb_downloads_dir = pathlib.Path(os.environ.get(
+            'QDB_DOWNLOADS_DIR',
+            self.questdb_dir / 'downloads'))
+        self.questdb_downloads_dir.mkdir(parents=True, exist_ok=True)
 
 
 def list_questdb_releases(max_results=1):
@@ -151,18 +168,42 @@ def install_questdb(vers: str, download_url: str):
         shutil.rmtree(version_dir / 'data')
         (version_dir / 'data' / 'log').mkdir(parents=True)
         return version_dir
-    sys.stderr.write(f'Downloading QuestDB v.{vers} from {download_url!r}.\n')
     archive_path = proj.questdb_downloads_dir / f'{vers}.tar.gz'
-
-    response = urllib.request.urlopen(download_url, timeout=300)
-    data = response.read()
-    with open(archive_path, 'wb') as archive_file:
-        archive_file.write(data)
+    if archive_path.exists():
+        sys.stderr.write(
+            f'Using previously downloaded QuestDB v.{vers} at {archive_path}.\n')
+    else:
+        sys.stderr.write(
+            f'Downloading QuestDB v.{vers} from {download_url!r}.\n')
+        response = urllib.request.urlopen(download_url, timeout=300)
+        data = response.read()
+        # Write to a unique temp file, then rename: Neither an interrupted
+        # download nor a concurrent run sharing the dir can corrupt it.
+        archive_file = tempfile.NamedTemporaryFile(
+            dir=proj.questdb_downloads_dir,
+            prefix=f'_tmp_{vers}_',
+            suffix='.tar.gz',
+            delete=False)
+        tmp_archive_path = pathlib.Path(archive_file.name)
+        try:
+            with archive_file:
+                archive_file.write(data)
+            tmp_archive_path.replace(archive_path)
+        except:
+            tmp_archive_path.unlink(missing_ok=True)
+            raise
     tmp_version_dir = proj.questdb_dir / f'_tmp_{vers}'
+    # Leftover from an interrupted extraction.
+    shutil.rmtree(tmp_version_dir, ignore_errors=True)
     try:
         archive = tarfile.open(archive_path)
         archive.extractall(tmp_version_dir)
         archive.close()
+    except (tarfile.TarError, EOFError, zlib.error):
+        shutil.rmtree(tmp_version_dir, ignore_errors=True)
+        # Corrupt or truncated archive: download it again next time.
+        archive_path.unlink(missing_ok=True)
+        raise
     except:
         shutil.rmtree(tmp_version_dir, ignore_errors=True)
         raise
@@ -243,6 +284,7 @@ class QuestDbFixture:
         self._conf_path = self._conf_dir / 'server.conf'
         self._log = None
         self._proc = None
+        self._http_conn = None
         self.host = 'localhost'
         self.http_server_port = None
         self.line_tcp_port = None
@@ -349,22 +391,37 @@ class QuestDbFixture:
             self._tls_proxy.start()
             self.tls_line_tcp_port = self._tls_proxy.listen_port
 
+    def _http_get(self, path):
+        """
+        GET `path` over a keep-alive connection reused across calls.
+        Returns the response body, regardless of the HTTP status.
+        """
+        for attempt in range(2):
+            if self._http_conn is None:
+                self._http_conn = http.client.HTTPConnection(
+                    self.host, self.http_server_port, timeout=5)
+            try:
+                self._http_conn.request('GET', path)
+                return self._http_conn.getresponse().read()
+            except (http.client.HTTPException, ConnectionError):
+                # The server may have dropped the idle connection: retry once.
+                self._http_conn.close()
+                self._http_conn = None
+                if attempt:
+                    raise
+
     def http_sql_query(self, sql_query):
-        url = (
-            f'http://{self.host}:{self.http_server_port}/exec?' +
-            urllib.parse.urlencode({'query': sql_query}))
-        buf = None
-        try:
-            resp = urllib.request.urlopen(url, timeout=5)
-            buf = resp.read()
-        except urllib.error.HTTPError as http_error:
-            buf = http_error.read()
+        buf = self._http_get(_exec_path(sql_query))
         try:
             data = json.loads(buf)
         except json.JSONDecodeError as jde:
-            # Include buffer in error message for easier debugging.
+            # Include the start of the buffer for easier debugging,
+            # but don't format a potentially huge response in full.
+            excerpt = repr(buf[:200])
+            if len(buf) > 200:
+                excerpt += f'... ({len(buf)} bytes)'
             raise json.JSONDecodeError(
-                f'Could not parse response: {buf!r}: {jde.msg}',
+                f'Could not parse response: {excerpt}: {jde.msg}',
                 jde.doc,
                 jde.pos)
         if 'error' in data:
@@ -395,10 +452,16 @@ class QuestDbFixture:
             timeout_sec=30,
             log=True,
             log_ctx=None):
+        count_query = f"select count() from '{table_name}'"
         sql_query = f"select * from '{table_name}'"
         http_response_log = []
         def check_table():
             try:
+                # Cheap probe first: only fetch all rows once enough are in.
+                count_resp = self.http_sql_query(count_query)
+                http_response_log.append((time.time(), count_resp))
+                if count_resp['dataset'][0][0] < min_rows:
+                    return False
                 resp = self.http_sql_query(sql_query)
                 http_response_log.append((time.time(), resp))
                 if not resp.get('dataset'):
@@ -410,7 +473,15 @@ class QuestDbFixture:
                 return None
 
         try:
-            return retry(check_table, timeout_sec=timeout_sec)
+            # Poll quickly at first (10ms, 20ms, 40ms, ..., 0.5s max):
+            # most tables show up within a few commit lag intervals.
+            return retry(
+                check_table,
+                timeout_sec=timeout_sec,
+                every=0.01,
+                backoff_factor=2.0,
+                backoff_till=0.5,
+                lead_sleep=None)
         except TimeoutError as toe:
             if log:
                 if log_ctx:
@@ -431,6 +502,9 @@ class QuestDbFixture:
     def stop(self):
         if self._tls_proxy:
             self._tls_proxy.stop()
+        if self._http_conn:
+            self._http_conn.close()
+            self._http_conn = None
         if self._proc:
             self._proc.terminate()
             self._proc.wait()
@@ -319,7 +319,7 @@ def _setup_cdll():
         c_line_sender_error_p_p)
     set_sig(
         dll.line_sender_must_close,
-        None,
+        c_bool,
         c_line_sender_p)
     set_sig(
         dll.line_sender_close,
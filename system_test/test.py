@@ -31,10 +31,10 @@ import os
 import shutil
 import pathlib
 import math
-import datetime
 import argparse
 import unittest
 import time
+import itertools
 import questdb_line_sender as qls
 import uuid
 from fixture import (
@@ -47,22 +47,42 @@ from fixture import (
     AUTH)
 import subprocess
 from collections import namedtuple
+from operator import itemgetter
 
 
 QDB_FIXTURE: QuestDbFixture = None
 TLS_PROXY_FIXTURE: TlsProxyFixture = None
 
 
+# Drawn once: distinguishes this run's tables from those of earlier runs.
+_RUN_ID = uuid.uuid4().hex[:12]
+_TABLE_COUNTER = itertools.count()
+
+
+def unique_table_name():
+    return f't_{_RUN_ID}_{next(_TABLE_COUNTER):x}'
+
+
 def retry_check_table(*args, **kwargs):
     return QDB_FIXTURE.retry_check_table(*args, **kwargs)
 
 
 def ns_to_qdb_date(at_ts_ns):
     # We first need to match QuestDB's internal microsecond resolution.
-    at_ts_us = int(at_ts_ns / 1000.0)
-    at_ts_sec = at_ts_us / 1000000.0
-    at_td = datetime.datetime.utcfromtimestamp(at_ts_sec)
-    return at_td.isoformat() + 'Z'
+    # Integer arithmetic only: nanosecond epoch values don't fit a double.
+    at_ts_sec, at_us = divmod(at_ts_ns // 1000, 1000000)
+    tm = time.gmtime(at_ts_sec)
+    return (
+        f'{tm.tm_year:04d}-{tm.tm_mon:02d}-{tm.tm_mday:02d}T'
+        f'{tm.tm_hour:02d}:{tm.tm_min:02d}:{tm.tm_sec:02d}.{at_us:06d}Z')
+
+
+_drop_last = itemgetter(slice(0, -1))
+
+
+def scrub_dataset(resp):
+    """The response rows as tuples, excluding the trailing timestamp column."""
+    return tuple(map(tuple, map(_drop_last, resp['dataset'])))
 
 
 # Valid keys, but not registered with the QuestDB fixture.
@@ -89,11 +109,210 @@ AUTH_MALFORMED2 = (
     "9iYksF4L6mfmArupv0CMoyVAWjQ4gNIou5noG8")
 
 
+# A 4-byte UTF-8 character: b'\xf0\x9f\x98\x81'.
+SMILIE = '\U0001F601'
+
+
+def _build_repeated_symbol_and_column_names(sender):
+    table_name = unique_table_name()
+    (sender
+        .table(table_name)
+        .symbol('a', 'A')
+        .symbol('a', 'B')
+        .column('b', False)
+        .column('b', 'C')
+        .at_now())
+    return table_name
+
+
+def _build_same_symbol_and_col_name(sender):
+    table_name = unique_table_name()
+    (sender
+        .table(table_name)
+        .symbol('a', 'A')
+        .column('a', 'B')
+        .at_now())
+    return table_name
+
+
+def _build_two_columns(sender):
+    table_name = unique_table_name()
+    (sender
+        .table(table_name)
+        .column('a', 'A')
+        .column('b', 'B')
+        .at_now())
+    return table_name
+
+
+def _build_timestamp_col(sender):
+    table_name = unique_table_name()
+    (sender
+        .table(table_name)
+        .column('a', qls.TimestampMicros(-1000000))
+        .at_now())
+    (sender
+        .table(table_name)
+        .column('a', qls.TimestampMicros(1000000))
+        .at_now())
+    return table_name
+
+
+def _build_underscores(sender):
+    table_name = f'_{unique_table_name()}_'
+    (sender
+        .table(table_name)
+        .symbol('_a_b_c_', 'A')
+        .column('_d_e_f_', True)
+        .at_now())
+    return table_name
+
+
+def _build_funky_chars(sender):
+    table_name = unique_table_name()
+    sender.table(table_name)
+    sender.symbol(SMILIE, SMILIE)
+    # for num in range(1, 32):
+    #     char = chr(num)
+    #     sender.column(char, char)
+    sender.at_now()
+    return table_name
+
+
+def _build_timestamp_column(sender):
+    table_name = unique_table_name()
+    ts = qls.TimestampMicros(3600000000)  # One hour past epoch.
+    (sender
+        .table(table_name)
+        .column('ts1', ts)
+        .at_now())
+    return table_name
+
+
+InsertCase = namedtuple(
+    'InsertCase',
+    ('name',             # Test method is `test_{name}`.
+     'build',            # `build(sender)` writes rows, returns the table.
+     'exp_columns',
+     'exp_dataset',      # Excludes the timestamp column.
+     'skip_upto',        # Skip for QuestDB versions `<=` to this.
+     'skip_msg'),
+    defaults=(None, None))
+
+
+# Tests that send rows and check what was stored.
+# Each becomes a `TestSender.test_{name}` method.
+INSERT_CASES = (
+    InsertCase(
+        'repeated_symbol_and_column_names',
+        _build_repeated_symbol_and_column_names,
+        ({'name': 'a', 'type': 'SYMBOL'},
+         {'name': 'b', 'type': 'BOOLEAN'},
+         {'name': 'timestamp', 'type': 'TIMESTAMP'}),
+        (('A', False),),
+        skip_upto=(6, 1, 2),
+        skip_msg='No support for duplicate column names.'),
+    InsertCase(
+        'same_symbol_and_col_name',
+        _build_same_symbol_and_col_name,
+        ({'name': 'a', 'type': 'SYMBOL'},
+         {'name': 'timestamp', 'type': 'TIMESTAMP'}),
+        (('A',),),
+        skip_upto=(6, 1, 2),
+        skip_msg='No support for duplicate column names.'),
+    InsertCase(
+        'two_columns',
+        _build_two_columns,
+        ({'name': 'a', 'type': 'STRING'},
+         {'name': 'b', 'type': 'STRING'},
+         {'name': 'timestamp', 'type': 'TIMESTAMP'}),
+        (('A', 'B'),)),
+    InsertCase(
+        'timestamp_col',
+        _build_timestamp_col,
+        ({'name': 'a', 'type': 'TIMESTAMP'},
+         {'name': 'timestamp', 'type': 'TIMESTAMP'}),
+        (('1969-12-31T23:59:59.000000Z',),
+         ('1970-01-01T00:00:01.000000Z',)),
+        skip_upto=(6, 0, 7, 1),
+        skip_msg='No support for user-provided timestamps.'),
+    InsertCase(
+        'underscores',
+        _build_underscores,
+        ({'name': '_a_b_c_', 'type': 'SYMBOL'},
+         {'name': '_d_e_f_', 'type': 'BOOLEAN'},
+         {'name': 'timestamp', 'type': 'TIMESTAMP'}),
+        (('A', True),)),
+    InsertCase(
+        'funky_chars',
+        _build_funky_chars,
+        ({'name': SMILIE, 'type': 'SYMBOL'},
+         {'name': 'timestamp', 'type': 'TIMESTAMP'}),
+        ((SMILIE,),),
+        skip_upto=(6, 0, 7, 1),
+        skip_msg='No unicode support.'),
+    InsertCase(
+        'timestamp_column',
+        _build_timestamp_column,
+        ({'name': 'ts1', 'type': 'TIMESTAMP'},
+         {'name': 'timestamp', 'type': 'TIMESTAMP'}),
+        (('1970-01-01T01:00:00.000000Z',),)))
+
+
 class TestSender(unittest.TestCase):
+    # Expected `columns` and timestamp-scrubbed `dataset` query results.
+    EXP_COLUMNS_THREE_ROWS = (
+        {'name': 'name_a', 'type': 'SYMBOL'},
+        {'name': 'name_b', 'type': 'BOOLEAN'},
+        {'name': 'name_c', 'type': 'LONG'},
+        {'name': 'name_d', 'type': 'DOUBLE'},
+        {'name': 'name_e', 'type': 'STRING'},
+        {'name': 'timestamp', 'type': 'TIMESTAMP'})
+    EXP_DATASET_THREE_ROWS = (
+        ('val_a', True, 42, 2.5, 'val_b'),
+        ('val_a', True, 42, 2.5, 'val_b'),
+        ('val_a', True, 42, 2.5, 'val_b'))
+
+    EXP_COLUMNS_SYMBOL_A = (
+        {'name': 'a', 'type': 'SYMBOL'},
+        {'name': 'timestamp', 'type': 'TIMESTAMP'})
+    EXP_COLUMNS_STRING_A = (
+        {'name': 'a', 'type': 'STRING'},
+        {'name': 'timestamp', 'type': 'TIMESTAMP'})
+    EXP_DATASET_A = (('A',),)
+
+    EXP_COLUMNS_FLOATS = (
+        {'name': 'n', 'type': 'DOUBLE'},
+        {'name': 'timestamp', 'type': 'TIMESTAMP'})
+
+    EXP_COLUMNS_EXAMPLE = (
+        {'name': 'id', 'type': 'SYMBOL'},
+        {'name': 'x', 'type': 'DOUBLE'},
+        {'name': 'y', 'type': 'DOUBLE'},
+        {'name': 'booked', 'type': 'BOOLEAN'},
+        {'name': 'passengers', 'type': 'LONG'},
+        {'name': 'driver', 'type': 'STRING'},
+        {'name': 'timestamp', 'type': 'TIMESTAMP'})
+    EXP_DATASET_EXAMPLE = ((
+        'd6e5fe92-d19f-482a-a97a-c105f547f721',
+        30.5,
+        -150.25,
+        True,
+        3,
+        'John Doe'),)
+
+    @classmethod
+    def setUpClass(cls):
+        # ILP/HTTP is served on the HTTP port, ILP/TCP on its own port.
+        cls._ilp_port = (
+            QDB_FIXTURE.http_server_port
+            if QDB_FIXTURE.http
+            else QDB_FIXTURE.line_tcp_port)
+
     def _mk_linesender(self, transactional=False):
         return qls.Sender(
             QDB_FIXTURE.host,
-            QDB_FIXTURE.http_server_port if QDB_FIXTURE.http else QDB_FIXTURE.line_tcp_port,
+            self._ilp_port,
             auth=AUTH if QDB_FIXTURE.auth else None,
             http=QDB_FIXTURE.http,
             transactional=transactional)
@@ -101,7 +320,7 @@ class TestSender(unittest.TestCase):
     def _expect_eventual_disconnect(self, sender):
         with self.assertRaisesRegex(
                 qls.SenderError, r'.*Could not flush buffer'):
-            table_name = uuid.uuid4().hex
+            table_name = unique_table_name()
             for _ in range(1000):
                 time.sleep(0.1)
                 (sender
@@ -110,92 +329,45 @@ class TestSender(unittest.TestCase):
                     .at_now())
                 sender.flush()
 
-    def test_insert_three_rows(self):
-        table_name = uuid.uuid4().hex
+    def _test_insert_case(self, case: InsertCase):
+        if case.skip_upto and QDB_FIXTURE.version <= case.skip_upto:
+            self.skipTest(case.skip_msg)
         pending = None
         with self._mk_linesender() as sender:
-            for _ in range(3):
-                (sender
-                    .table(table_name)
-                    .symbol('name_a', 'val_a')
-                    .column('name_b', True)
-                    .column('name_c', 42)
-                    .column('name_d', 2.5)
-                    .column('name_e', 'val_b')
-                    .at_now())
-            pending = sender.buffer.peek()
-            sender.flush()
-
-        resp = retry_check_table(table_name, min_rows=3, log_ctx=pending)
-        exp_columns = [
-            {'name': 'name_a', 'type': 'SYMBOL'},
-            {'name': 'name_b', 'type': 'BOOLEAN'},
-            {'name': 'name_c', 'type': 'LONG'},
-            {'name': 'name_d', 'type': 'DOUBLE'},
-            {'name': 'name_e', 'type': 'STRING'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
-
-        exp_dataset = [  # Comparison excludes timestamp column.
-            ['val_a', True, 42, 2.5, 'val_b'],
-            ['val_a', True, 42, 2.5, 'val_b'],
-            ['val_a', True, 42, 2.5, 'val_b']]
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
-
-    def test_repeated_symbol_and_column_names(self):
-        if QDB_FIXTURE.version <= (6, 1, 2):
-            self.skipTest('No support for duplicate column names.')
-            return
-        table_name = uuid.uuid4().hex
-        pending = None
-        with self._mk_linesender() as sender:
-            (sender
-                .table(table_name)
-                .symbol('a', 'A')
-                .symbol('a', 'B')
-                .column('b', False)
-                .column('b', 'C')
-                .at_now())
+            table_name = case.build(sender)
             pending = sender.buffer.peek()
 
         resp = retry_check_table(table_name, log_ctx=pending)
-        exp_columns = [
-            {'name': 'a', 'type': 'SYMBOL'},
-            {'name': 'b', 'type': 'BOOLEAN'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
+        self.assertEqual(tuple(resp['columns']), case.exp_columns)
+        self.assertEqual(scrub_dataset(resp), case.exp_dataset)
 
-        exp_dataset = [['A', False]]  # Comparison excludes timestamp column.
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
-
-    def test_same_symbol_and_col_name(self):
-        if QDB_FIXTURE.version <= (6, 1, 2):
-            self.skipTest('No support for duplicate column names.')
-            return
-        table_name = uuid.uuid4().hex
+    def test_insert_three_rows(self):
+        table_name = unique_table_name()
         pending = None
         with self._mk_linesender() as sender:
-            (sender
-                .table(table_name)
-                .symbol('a', 'A')
-                .column('a', 'B')
-                .at_now())
+            table, symbol, column, at_now = (
+                sender.table, sender.symbol, sender.column, sender.at_now)
+            for _ in range(3):
+                table(table_name)
+                symbol('name_a', 'val_a')
+                column('name_b', True)
+                column('name_c', 42)
+                column('name_d', 2.5)
+                column('name_e', 'val_b')
+                at_now()
             pending = sender.buffer.peek()
 
-        resp = retry_check_table(table_name, log_ctx=pending)
-        exp_columns = [
-            {'name': 'a', 'type': 'SYMBOL'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
+            # All three rows go out in a single flush.
+            self.assertEqual(pending.count('\n'), 3)
+            sender.flush()
 
-        exp_dataset = [['A']]  # Comparison excludes timestamp column.
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
+        resp = retry_check_table(table_name, min_rows=3, log_ctx=pending)
+        self.assertEqual(
+            tuple(resp['columns']), self.EXP_COLUMNS_THREE_ROWS)
+        self.assertEqual(scrub_dataset(resp), self.EXP_DATASET_THREE_ROWS)
 
     def _test_single_symbol_impl(self, sender):
-        table_name = uuid.uuid4().hex
+        table_name = unique_table_name()
         pending = None
         with sender:
             (sender
@@ -205,42 +377,14 @@ class TestSender(unittest.TestCase):
             pending = sender.buffer.peek()
 
         resp = retry_check_table(table_name, log_ctx=pending)
-        exp_columns = [
-            {'name': 'a', 'type': 'SYMBOL'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
-
-        exp_dataset = [['A']]  # Comparison excludes timestamp column.
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
+        self.assertEqual(tuple(resp['columns']), self.EXP_COLUMNS_SYMBOL_A)
+        self.assertEqual(scrub_dataset(resp), self.EXP_DATASET_A)
 
     def test_single_symbol(self):
         self._test_single_symbol_impl(self._mk_linesender())
 
-    def test_two_columns(self):
-        table_name = uuid.uuid4().hex
-        pending = None
-        with self._mk_linesender() as sender:
-            (sender
-                .table(table_name)
-                .column('a', 'A')
-                .column('b', 'B')
-                .at_now())
-            pending = sender.buffer.peek()
-
-        resp = retry_check_table(table_name, log_ctx=pending)
-        exp_columns = [
-            {'name': 'a', 'type': 'STRING'},
-            {'name': 'b', 'type': 'STRING'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
-
-        exp_dataset = [['A', 'B']]  # Comparison excludes timestamp column.
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
-
     def test_mismatched_types_across_rows(self):
-        table_name = uuid.uuid4().hex
+        table_name = unique_table_name()
         pending = None
         with self._mk_linesender() as sender:
             (sender
@@ -272,14 +416,9 @@ class TestSender(unittest.TestCase):
         else:
             # We only ever get the first row back.
             resp = retry_check_table(table_name, log_ctx=pending)
-            exp_columns = [
-                {'name': 'a', 'type': 'STRING'},
-                {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-            self.assertEqual(resp['columns'], exp_columns)
-
-            exp_dataset = [['A']]  # Comparison excludes timestamp column.
-            scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-            self.assertEqual(scrubbed_dataset, exp_dataset)
+            self.assertEqual(
+                tuple(resp['columns']), self.EXP_COLUMNS_STRING_A)
+            self.assertEqual(scrub_dataset(resp), self.EXP_DATASET_A)
 
             # The second one is dropped and will not appear in results.
             with self.assertRaises(TimeoutError):
@@ -289,7 +428,7 @@ class TestSender(unittest.TestCase):
         if QDB_FIXTURE.version <= (6, 0, 7, 1):
             self.skipTest('No support for user-provided timestamps.')
             return
-        table_name = uuid.uuid4().hex
+        table_name = unique_table_name()
         at_ts_ns = 1647357688714369403
         pending = None
         with self._mk_linesender() as sender:
@@ -306,7 +445,7 @@ class TestSender(unittest.TestCase):
         if QDB_FIXTURE.version <= (6, 0, 7, 1):
             self.skipTest('No support for user-provided timestamps.')
             return
-        table_name = uuid.uuid4().hex
+        table_name = unique_table_name()
         at_ts_ns = -10000000
         with self.assertRaisesRegex(qls.SenderError, r'Bad call to'):
             with self._mk_linesender() as sender:
@@ -316,82 +455,6 @@ class TestSender(unittest.TestCase):
                         .symbol('a', 'A')
                         .at(at_ts_ns))
 
-    def test_timestamp_col(self):
-        if QDB_FIXTURE.version <= (6, 0, 7, 1):
-            self.skipTest('No support for user-provided timestamps.')
-            return
-        table_name = uuid.uuid4().hex
-        pending = None
-        with self._mk_linesender() as sender:
-            (sender
-                .table(table_name)
-                .column('a', qls.TimestampMicros(-1000000))
-                .at_now())
-            (sender
-                .table(table_name)
-                .column('a', qls.TimestampMicros(1000000))
-                .at_now())
-            pending = sender.buffer.peek()
-
-        resp = retry_check_table(table_name, log_ctx=pending)
-        exp_columns = [
-            {'name': 'a', 'type': 'TIMESTAMP'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
-
-        exp_dataset = [['1969-12-31T23:59:59.000000Z'], ['1970-01-01T00:00:01.000000Z']]
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
-        
-
-    def test_underscores(self):
-        table_name = f'_{uuid.uuid4().hex}_'
-        pending = None
-        with self._mk_linesender() as sender:
-            (sender
-                .table(table_name)
-                .symbol('_a_b_c_', 'A')
-                .column('_d_e_f_', True)
-                .at_now())
-            pending = sender.buffer.peek()
-
-        resp = retry_check_table(table_name, log_ctx=pending)
-        exp_columns = [
-            {'name': '_a_b_c_', 'type': 'SYMBOL'},
-            {'name': '_d_e_f_', 'type': 'BOOLEAN'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
-
-        exp_dataset = [['A', True]]  # Comparison excludes timestamp column.
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
-
-    def test_funky_chars(self):
-        if QDB_FIXTURE.version <= (6, 0, 7, 1):
-            self.skipTest('No unicode support.')
-            return
-        table_name = uuid.uuid4().hex
-        smilie = b'\xf0\x9f\x98\x81'.decode('utf-8')
-        pending = None
-        with self._mk_linesender() as sender:
-            sender.table(table_name)
-            sender.symbol(smilie, smilie)
-            # for num in range(1, 32):
-            #     char = chr(num)
-            #     sender.column(char, char)
-            sender.at_now()
-            pending = sender.buffer.peek()
-
-        resp = retry_check_table(table_name, log_ctx=pending)
-        exp_columns = [
-            {'name': smilie, 'type': 'SYMBOL'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
-
-        exp_dataset = [[smilie]]  # Comparison excludes timestamp column.
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
-
     def test_floats(self):
         if QDB_FIXTURE.version <= (6, 1, 2):
             self.skipTest('Float issues support')
@@ -422,23 +485,21 @@ class TestSender(unittest.TestCase):
             # -2.2250738585072014e-308,
             # 1.7976931348623157e+308,
             # -1.7976931348623157e+308]
-        table_name = uuid.uuid4().hex
+        table_name = unique_table_name()
         pending = None
         with self._mk_linesender() as sender:
+            table, column, at_now = sender.table, sender.column, sender.at_now
             for num in numbers:
-                sender.table(table_name)
-                sender.column('n', num)
-                sender.at_now()
+                table(table_name)
+                column('n', num)
+                at_now()
             pending = sender.buffer.peek()
 
         resp = retry_check_table(
             table_name,
             min_rows=len(numbers),
             log_ctx=pending)
-        exp_columns = [
-            {'name': 'n', 'type': 'DOUBLE'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
+        self.assertEqual(tuple(resp['columns']), self.EXP_COLUMNS_FLOATS)
 
         def massage(num):
             if math.isnan(num) or math.isinf(num):
@@ -448,30 +509,9 @@ class TestSender(unittest.TestCase):
             else:
                 return num
 
-        # Comparison excludes timestamp column.
-        exp_dataset = [[massage(num)] for num in numbers]
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
-
-    def test_timestamp_column(self):
-        table_name = uuid.uuid4().hex
-        pending = None
-        ts = qls.TimestampMicros(3600000000)  # One hour past epoch.
-        with self._mk_linesender() as sender:
-            (sender
-                .table(table_name)
-                .column('ts1', ts)
-                .at_now())
-            pending = sender.buffer.peek()
-
-        resp = retry_check_table(table_name, log_ctx=pending)
-        exp_columns = [
-            {'name': 'ts1', 'type': 'TIMESTAMP'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
-        exp_dataset = [['1970-01-01T01:00:00.000000Z']]
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
+        # Compare column-wise: `n` values, excluding the timestamp column.
+        n_column, _timestamp_column = zip(*resp['dataset'])
+        self.assertEqual(n_column, tuple(massage(num) for num in numbers))
 
     def _test_example(self, bin_name, table_name, tls=False):
         if tls and not QDB_FIXTURE.auth:
@@ -483,7 +523,7 @@ class TestSender(unittest.TestCase):
             bin_path = next(proj.build_dir.glob(f'**/{bin_name}{ext}'))
         except StopIteration:
             raise RuntimeError(f'Could not find {bin_name}{ext} in {proj.build_dir}')
-        port = QDB_FIXTURE.http_server_port if QDB_FIXTURE.http else QDB_FIXTURE.line_tcp_port
+        port = self._ilp_port
         args = [str(bin_path)]
         if tls:
             ca_path = proj.tls_certs_dir / 'server_rootCA.pem'
@@ -494,25 +534,8 @@ class TestSender(unittest.TestCase):
 
         # Check inserted data.
         resp = retry_check_table(table_name)
-        exp_columns = [
-            {'name': 'id', 'type': 'SYMBOL'},
-            {'name': 'x', 'type': 'DOUBLE'},
-            {'name': 'y', 'type': 'DOUBLE'},
-            {'name': 'booked', 'type': 'BOOLEAN'},
-            {'name': 'passengers', 'type': 'LONG'},
-            {'name': 'driver', 'type': 'STRING'},
-            {'name': 'timestamp', 'type': 'TIMESTAMP'}]
-        self.assertEqual(resp['columns'], exp_columns)
-
-        exp_dataset = [[
-            'd6e5fe92-d19f-482a-a97a-c105f547f721',
-            30.5,
-            -150.25,
-            True,
-            3,
-            'John Doe']]  # Comparison excludes timestamp column.
-        scrubbed_dataset = [row[:-1] for row in resp['dataset']]
-        self.assertEqual(scrubbed_dataset, exp_dataset)
+        self.assertEqual(tuple(resp['columns']), self.EXP_COLUMNS_EXAMPLE)
+        self.assertEqual(scrub_dataset(resp), self.EXP_DATASET_EXAMPLE)
 
     def test_c_example(self):
         suffix = '_auth' if QDB_FIXTURE.auth else ''
@@ -557,7 +580,7 @@ class TestSender(unittest.TestCase):
                     r'.*not receive auth challenge.*'):
                 sender.connect()
         else:
-            table_name = uuid.uuid4().hex
+            table_name = unique_table_name()
             with sender:  # Connecting will not fail.
 
                 # The sending the first line will not fail.
@@ -653,7 +676,7 @@ class TestSender(unittest.TestCase):
             self.skipTest('HTTP-only test')
         if QDB_FIXTURE.version <= (7, 3, 7):
             self.skipTest('No ILP/HTTP support')
-        table_name = uuid.uuid4().hex
+        table_name = unique_table_name()
         with self._mk_linesender(transactional=True) as sender:
             sender.table(table_name).column('col1', 'v1').at(time.time_ns())
             sender.table(table_name).column('col1', 'v2').at(time.time_ns())
@@ -682,10 +705,29 @@ class TestSender(unittest.TestCase):
                 pass
 
 
+def _add_insert_case_tests(cls, cases):
+    for case in cases:
+        def test(self, case=case):
+            self._test_insert_case(case)
+        test.__name__ = f'test_{case.name}'
+        test.__qualname__ = f'{cls.__name__}.{test.__name__}'
+        setattr(cls, test.__name__, test)
+
+
+_add_insert_case_tests(TestSender, INSERT_CASES)
+
+
 def parse_args():
     parser = argparse.ArgumentParser('Run system tests.')
     sub_p = parser.add_subparsers(dest='command')
-    run_p = sub_p.add_parser('run', help='Run tests')
+    run_p = sub_p.add_parser(
+        'run',
+        help='Run tests',
+        description=(
+            'Run tests. Downloaded QuestDB releases are kept in ' +
+            '`build/questdb/downloads`. Set the `QDB_DOWNLOADS_DIR` ' +
+            'environment variable to keep them elsewhere, ' +
+            'e.g. to reuse them across clean builds.'))
     run_p.add_argument(
         '--unittest-help',
         action='store_true',